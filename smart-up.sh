@@ -353,31 +353,49 @@ def current_source_commit(component):
     return git_last_change((component.get("config_dirs") or []) + (component.get("source_paths") or []))
 
 
-def current_runtime_config_hash(service_name):
-    if service_name not in existing_services:
-        return ""
+runtime_config_hashes = None
+
+
+def load_runtime_config_hashes():
+    # One compose ps and one batched docker inspect for the whole project, instead of two
+    # subprocesses per service on a fresh deploy state.
+    hashes = {}
     compose_ps = subprocess.run(
-        ["docker", "compose", "-f", compose_file_path, "ps", "-a", "-q", service_name],
+        ["docker", "compose", "-f", compose_file_path, "ps", "-a", "-q"],
         capture_output=True,
         text=True,
         check=False,
     )
-    container_id = compose_ps.stdout.strip().splitlines()[0] if compose_ps.stdout.strip() else ""
-    if not container_id:
-        return ""
+    container_ids = [line.strip() for line in compose_ps.stdout.splitlines() if line.strip()]
+    if not container_ids:
+        return hashes
     inspect = subprocess.run(
         [
             "docker",
             "inspect",
             "-f",
-            '{{ index .Config.Labels "com.docker.compose.config-hash" }}',
-            container_id,
+            '{{ index .Config.Labels "com.docker.compose.service" }}|{{ index .Config.Labels "com.docker.compose.config-hash" }}',
+            *container_ids,
         ],
         capture_output=True,
         text=True,
         check=False,
     )
-    return inspect.stdout.strip() if inspect.returncode == 0 else ""
+    # docker inspect exits non-zero if any container vanished meanwhile but still reports the rest.
+    for raw_line in inspect.stdout.splitlines():
+        service_name, _, config_hash = raw_line.strip().partition("|")
+        if service_name and config_hash:
+            hashes.setdefault(service_name, config_hash)
+    return hashes
+
+
+def current_runtime_config_hash(service_name):
+    global runtime_config_hashes
+    if service_name not in existing_services:
+        return ""
+    if runtime_config_hashes is None:
+        runtime_config_hashes = load_runtime_config_hashes()
+    return runtime_config_hashes.get(service_name, "")
 
 
 def source_changed(current_commit, deploy_status):
@@ -20,6 +20,9 @@ COLLECTION_NAME = "stack_knowledge"
 VECTOR_SIZE = 1024  # bge-m3
 KNOWLEDGE_DIR = Path(__file__).parent
 
+# Single pooled session so embed calls and batched upserts reuse keep-alive connections
+SESSION = requests.Session()
+
 def create_collection():
     """Create or recreate Qdrant collection"""
     print(f"Creating collection: {COLLECTION_NAME}")
@@ -30,13 +33,13 @@ def create_collection():
 
     # Delete existing
     try:
-        requests.delete(f"{QDRANT_URL}/collections/{COLLECTION_NAME}", headers=headers)
+        SESSION.delete(f"{QDRANT_URL}/collections/{COLLECTION_NAME}", headers=headers)
         print("Deleted existing collection")
     except:
         print("No existing collection to delete")
 
     # Create new
-    response = requests.put(
+    response = SESSION.put(
         f"{QDRANT_URL}/collections/{COLLECTION_NAME}",
         headers=headers,
         json={
@@ -55,7 +58,7 @@ def create_collection():
 
 def generate_embedding(text: str) -> List[float]:
     """Generate embedding using bge-m3 model"""
-    response = requests.post(
+    response = SESSION.post(
         f"{EMBEDDING_URL}/embed",
         json={"inputs": text}
     )
@@ -188,7 +191,7 @@ def ingest_documents():
 
     for i in range(0, len(all_points), batch_size):
         batch = all_points[i:i+batch_size]
-        response = requests.put(
+        response = SESSION.put(
             f"{QDRANT_URL}/collections/{COLLECTION_NAME}/points",
             headers=headers,
             json={"points": batch}
@@ -207,7 +210,7 @@ def verify_collection():
     headers = {}
     if QDRANT_API_KEY:
         headers["api-key"] = QDRANT_API_KEY
-    response = requests.get(f"{QDRANT_URL}/collections/{COLLECTION_NAME}", headers=headers)
+    response = SESSION.get(f"{QDRANT_URL}/collections/{COLLECTION_NAME}", headers=headers)
 
     if response.status_code == 200:
         info = response.json()
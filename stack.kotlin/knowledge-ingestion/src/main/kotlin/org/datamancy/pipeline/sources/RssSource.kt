@@ -3,17 +3,28 @@ package org.datamancy.pipeline.sources
 import com.rometools.rome.io.SyndFeedInput
 import com.rometools.rome.io.XmlReader
 import io.github.oshai.kotlinlogging.KotlinLogging
+import kotlinx.coroutines.CancellationException
 import kotlinx.coroutines.flow.Flow
 import kotlinx.coroutines.flow.flow
+import okhttp3.OkHttpClient
+import okhttp3.Request
 import org.datamancy.pipeline.core.Source
-import java.net.URI
+import java.io.ByteArrayInputStream
+import java.util.concurrent.ConcurrentHashMap
+import java.util.concurrent.TimeUnit
 import java.util.concurrent.atomic.AtomicLong
 
 private val logger = KotlinLogging.logger {}
 
+private val httpClient = OkHttpClient.Builder()
+    .connectTimeout(30, TimeUnit.SECONDS)
+    .readTimeout(60, TimeUnit.SECONDS)
+    .build()
+
 
 class RssSource(
-    private val feedUrls: List<String>
+    private val feedUrls: List<String>,
+    private val validators: FeedValidatorCache = FeedValidatorCache()
 ) : Source<RssArticle> {
     override val name = "RssSource"
 
@@ -29,14 +40,41 @@ class RssSource(
                     isAllowDoctypes = true  
                 }
 
+                val cached = validators.get(feedUrl)
+                val request = Request.Builder()
+                    .url(feedUrl)
+                    .apply {
+                        cached?.etag?.let { header("If-None-Match", it) }
+                        cached?.lastModified?.let { header("If-Modified-Since", it) }
+                    }
+                    .build()
+
                 
-                val feed = URI(feedUrl).toURL().openStream().use { stream ->
-                    XmlReader(stream).use { reader ->
-                        feedsFetched.incrementAndGet()
-                        feedInput.build(reader)
+                val fetched = httpClient.newCall(request).execute().use { response ->
+                    when {
+                        response.code == 304 -> null
+                        !response.isSuccessful -> throw IllegalStateException("HTTP ${response.code} ${response.message}")
+                        else -> Triple(
+                            response.body?.bytes() ?: ByteArray(0),
+                            response.header("ETag"),
+                            response.header("Last-Modified")
+                        )
                     }
                 }
 
+                if (fetched == null) {
+                    logger.info { "RSS feed not modified since last poll: $feedUrl" }
+                    return@forEach
+                }
+
+                val (body, etag, lastModified) = fetched
+                bytesDownloaded.addAndGet(body.size.toLong())
+                feedsFetched.incrementAndGet()
+
+                val feed = XmlReader(ByteArrayInputStream(body)).use { reader ->
+                    feedInput.build(reader)
+                }
+
                 feed.entries.forEach { entry ->
                     val article = RssArticle(
                         guid = entry.uri ?: entry.link ?: "${feed.title}-${entry.title}".hashCode().toString(),
@@ -53,7 +91,12 @@ class RssSource(
                     emit(article)
                 }
 
+                // Saved only after every entry was emitted, so a cancelled run re-fetches next poll
+                validators.put(feedUrl, etag, lastModified)
+
                 logger.info { "Fetched ${feed.entries.size} articles from $feedUrl" }
+            } catch (e: CancellationException) {
+                throw e
             } catch (e: Exception) {
                 logger.error(e) { "Failed to fetch RSS feed $feedUrl: ${e.message}" }
             }
@@ -73,6 +116,26 @@ class RssSource(
     }
 }
 
+
+class FeedValidatorCache {
+    private val validators = ConcurrentHashMap<String, FeedValidators>()
+
+    fun get(feedUrl: String): FeedValidators? = validators[feedUrl]
+
+    fun put(feedUrl: String, etag: String?, lastModified: String?) {
+        if (etag == null && lastModified == null) {
+            validators.remove(feedUrl)
+        } else {
+            validators[feedUrl] = FeedValidators(etag, lastModified)
+        }
+    }
+}
+
+data class FeedValidators(
+    val etag: String?,
+    val lastModified: String?
+)
+
 data class IOStats(
     val bytesDownloaded: Long,
     val feedsFetched: Long
@@ -9,6 +9,7 @@ import org.datamancy.pipeline.scheduling.ResyncStrategy
 import org.datamancy.pipeline.scheduling.RunMetadata
 import org.datamancy.pipeline.scheduling.RunType
 import org.datamancy.pipeline.sinks.BookStackDocument
+import org.datamancy.pipeline.sources.FeedValidatorCache
 import org.datamancy.pipeline.sources.RssArticle
 import org.datamancy.pipeline.sources.RssSource
 import java.time.Instant
@@ -22,6 +23,8 @@ class RssStandardizedSource(
 
     override val name = "rss"
 
+    private val validators = FeedValidatorCache()
+
     override fun resyncStrategy(): ResyncStrategy {
         
         return ResyncStrategy.Hourly(minute = 0)
@@ -51,7 +54,7 @@ class RssStandardizedSource(
         }
 
         
-        return org.datamancy.pipeline.sources.RssSource(feedUrls)
+        return org.datamancy.pipeline.sources.RssSource(feedUrls, validators)
             .fetch()
             .map { article -> RssChunkableArticle(article) }
     }
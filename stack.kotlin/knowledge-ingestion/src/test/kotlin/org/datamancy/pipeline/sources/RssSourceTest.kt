@@ -0,0 +1,141 @@
+package org.datamancy.pipeline.sources
+
+import com.sun.net.httpserver.HttpExchange
+import com.sun.net.httpserver.HttpServer
+import kotlinx.coroutines.flow.take
+import kotlinx.coroutines.flow.toList
+import kotlinx.coroutines.runBlocking
+import org.junit.jupiter.api.AfterEach
+import org.junit.jupiter.api.BeforeEach
+import org.junit.jupiter.api.Test
+import java.net.InetSocketAddress
+import java.util.concurrent.atomic.AtomicInteger
+import kotlin.test.assertEquals
+import kotlin.test.assertNull
+
+
+class RssSourceTest {
+
+    private val feedXml = """
+        <?xml version="1.0" encoding="UTF-8"?>
+        <rss version="2.0">
+          <channel>
+            <title>Test Feed</title>
+            <link>https://example.com</link>
+            <description>Test</description>
+            <item>
+              <title>First</title>
+              <link>https://example.com/1</link>
+              <guid>https://example.com/1</guid>
+              <description>Hello</description>
+            </item>
+            <item>
+              <title>Second</title>
+              <link>https://example.com/2</link>
+              <guid>https://example.com/2</guid>
+              <description>World</description>
+            </item>
+          </channel>
+        </rss>
+    """.trimIndent()
+
+    private val etag = "\"v1\""
+    private val lastModified = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    private lateinit var server: HttpServer
+    private val notModifiedResponses = AtomicInteger(0)
+
+    @BeforeEach
+    fun setUp() {
+        server = HttpServer.create(InetSocketAddress("127.0.0.1", 0), 0)
+        server.createContext("/etag") { exchange ->
+            if (exchange.requestHeaders.getFirst("If-None-Match") == etag) {
+                sendNotModified(exchange)
+            } else {
+                sendFeed(exchange, "ETag", etag)
+            }
+        }
+        server.createContext("/last-modified") { exchange ->
+            if (exchange.requestHeaders.getFirst("If-Modified-Since") == lastModified) {
+                sendNotModified(exchange)
+            } else {
+                sendFeed(exchange, "Last-Modified", lastModified)
+            }
+        }
+        server.start()
+    }
+
+    @AfterEach
+    fun tearDown() {
+        server.stop(0)
+    }
+
+    private fun url(path: String) = "http://127.0.0.1:${server.address.port}$path"
+
+    private fun sendNotModified(exchange: HttpExchange) {
+        notModifiedResponses.incrementAndGet()
+        exchange.sendResponseHeaders(304, -1)
+        exchange.close()
+    }
+
+    private fun sendFeed(exchange: HttpExchange, validatorHeader: String, validatorValue: String) {
+        val body = feedXml.toByteArray()
+        exchange.responseHeaders.add(validatorHeader, validatorValue)
+        exchange.responseHeaders.add("Content-Type", "application/rss+xml")
+        exchange.sendResponseHeaders(200, body.size.toLong())
+        exchange.responseBody.use { it.write(body) }
+        exchange.close()
+    }
+
+    @Test
+    fun `test unchanged feed is skipped via ETag`() = runBlocking {
+        val feedUrl = url("/etag")
+        val validators = FeedValidatorCache()
+
+        val first = RssSource(listOf(feedUrl), validators).fetch().toList()
+        assertEquals(2, first.size)
+        assertEquals(etag, validators.get(feedUrl)?.etag)
+
+        val second = RssSource(listOf(feedUrl), validators).fetch().toList()
+        assertEquals(0, second.size)
+        assertEquals(1, notModifiedResponses.get())
+    }
+
+    @Test
+    fun `test unchanged feed is skipped via Last-Modified`() = runBlocking {
+        val feedUrl = url("/last-modified")
+        val validators = FeedValidatorCache()
+
+        val first = RssSource(listOf(feedUrl), validators).fetch().toList()
+        assertEquals(2, first.size)
+        assertNull(validators.get(feedUrl)?.etag)
+        assertEquals(lastModified, validators.get(feedUrl)?.lastModified)
+
+        val second = RssSource(listOf(feedUrl), validators).fetch().toList()
+        assertEquals(0, second.size)
+        assertEquals(1, notModifiedResponses.get())
+    }
+
+    @Test
+    fun `test partially collected feed is fetched again on next poll`() = runBlocking {
+        val feedUrl = url("/etag")
+        val validators = FeedValidatorCache()
+
+        val partial = RssSource(listOf(feedUrl), validators).fetch().take(1).toList()
+        assertEquals(listOf("https://example.com/1"), partial.map { it.guid })
+        assertNull(validators.get(feedUrl))
+
+        val next = RssSource(listOf(feedUrl), validators).fetch().toList()
+        assertEquals(listOf("https://example.com/1", "https://example.com/2"), next.map { it.guid })
+        assertEquals(0, notModifiedResponses.get())
+    }
+
+    @Test
+    fun `test validators are dropped when server sends none`() {
+        val validators = FeedValidatorCache()
+        validators.put("https://example.com/feed", "\"abc\"", null)
+        validators.put("https://example.com/feed", null, null)
+
+        assertNull(validators.get("https://example.com/feed"))
+    }
+}